@@ -11,18 +11,13 @@ The application provides multiple features including:
 """
 
 import streamlit as st
-import pandas as pd
-import plotly.express as px
+import streamlit.components.v1 as components
 from datetime import datetime, timedelta
-import json
 import io
-import base64
 import os
 import tempfile
 import webbrowser
-from dive_log import DiveLog, save_dive_log
-from dive_travel import DiveTravelCalculator
-from dive_journal import DiveJournal
+from dive_log import DiveLog, save_dive_log, load_dive_logs as read_dive_logs, DIVE_LOGS_FILE
 from dive_table import (
     get_pressure_group,  # Calculate pressure group based on depth/time
     get_new_group_after_surface_interval as get_new_pressure_group,  # Calculate new group after surface interval
@@ -30,15 +25,103 @@ from dive_table import (
     check_ndl,  # Check no-decompression limits
     calculate_total_bottom_time,  # Calculate total bottom time including residual nitrogen
     validate_repetitive_dive,  # Validate safety of repetitive dives
-    no_deco_limits  # PADI no-decompression limits table
+    AVAILABLE_DEPTHS  # Table depths in ascending order
 )
 
-# Read and encode the tank image
-def get_tank_image_base64():
-    image_path = os.path.join(os.path.dirname(__file__), "static", "images", "tank.png")
-    with open(image_path, "rb") as image_file:
-        encoded_string = base64.b64encode(image_file.read()).decode()
-    return f"data:image/png;base64,{encoded_string}"
+# Fixed widget options
+_ACTIVITIES = ("Recreation", "Wreck", "Reef", "Navigation", "Cave", "Search & Recovery", "Photography")
+_EXPOSURE_ITEMS = ("Full", "Shorty", "Boots", "Hood", "Gloves")
+_VERIFICATION_TYPES = ("Instructor", "Divemaster", "Buddy")
+_TRAVEL_DEPTHS = (10, 15, 20, 25, 30, 35, 40, 50, 60, 70, 80, 90, 100, 110, 120, 130)  # Common diving depths
+
+# Windy weather map embed; the URL is fixed, so the markup is a constant
+_WINDY_HTML = """
+    <div style="height: 800px;">
+        <iframe 
+            src="https://embed.windy.com/embed2.html?lat=25.000&lon=-80.000&zoom=5&level=surface&overlay=wind&menu=&message=&marker=&calendar=&pressure=&type=map&location=coordinates&detail=&detailLat=25.000&detailLon=-80.000&metricWind=default&metricTemp=default&radarRange=-1"
+            style="width: 100%; height: 100%; border: none;">
+        </iframe>
+    </div>
+"""
+
+# Fragments rerun only their own function when a widget inside them changes.
+# Older Streamlit releases ship them as experimental_fragment or not at all,
+# in which case the page simply renders as a normal function.
+def _compat_fragment(func):
+    fragment = getattr(st, "fragment", None) or getattr(st, "experimental_fragment", None)
+    return fragment(func) if fragment else func
+
+# Tank logo served by Streamlit's static file route (see .streamlit/config.toml),
+# so the browser fetches and caches it instead of receiving it inline on every rerun
+_TANK_IMAGE_URL = "./app/static/images/tank.png"
+
+# Home page content, built once at import: the instruction sections and
+# safety notes go to the browser as a single element
+_HOME_HTML = """
+<div class="home-content">
+    <h3>How to Use This Application</h3>
+    <div class="instruction-section">
+        <strong>1. Logging a New Dive</strong>
+        <ul>
+            <li>Click "Log New Dive" in the sidebar</li>
+            <li>Fill in dive details (date, location, depth, duration)</li>
+            <li>Add any buddy information and personal notes</li>
+            <li>Click "Save Dive Log" to store your entry</li>
+        </ul>
+    </div>
+    <div class="instruction-section">
+        <strong>2. Viewing Your Dive History</strong>
+        <ul>
+            <li>Select "View Dive Logs" from the sidebar</li>
+            <li>Browse through your past dives</li>
+            <li>Use filters to find specific dives</li>
+            <li>Export logs if needed</li>
+        </ul>
+    </div>
+    <div class="instruction-section">
+        <strong>3. Planning Your Next Dive</strong>
+        <ul>
+            <li>Go to "Dive Planner"</li>
+            <li>Enter your planned depth and time</li>
+            <li>The planner will calculate your pressure group</li>
+            <li>For repetitive dives, enter surface interval to get adjusted times</li>
+        </ul>
+    </div>
+    <div class="instruction-section">
+        <strong>4. Travel Planning</strong>
+        <ul>
+            <li>Use "Travel Planner" for trip organization</li>
+            <li>Input destination and dates</li>
+            <li>Track equipment and documentation needs</li>
+        </ul>
+    </div>
+    <div class="instruction-section">
+        <strong>5. Weather Check</strong>
+        <ul>
+            <li>Check "Weather & Conditions" before your dive</li>
+            <li>View current conditions at dive sites</li>
+            <li>Make informed decisions about dive timing</li>
+        </ul>
+    </div>
+    <div class="instruction-section">
+        <strong>6. Keeping a Dive Journal</strong>
+        <ul>
+            <li>Select "Write Journal" to write about your experiences</li>
+            <li>Add detailed observations and memories</li>
+            <li>View past entries in "My Journals"</li>
+        </ul>
+    </div>
+    <div class="safety-notes">
+        <h3>Safety Notes</h3>
+        <ul>
+            <li>Always follow safe diving practices</li>
+            <li>Stay within no-decompression limits</li>
+            <li>Plan your dives and dive your plan</li>
+            <li>Never dive alone</li>
+        </ul>
+    </div>
+</div>
+"""
 
 st.set_page_config(
     page_title="Scuba Diving Assistant",
@@ -47,8 +130,9 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Apply custom CSS
-st.markdown("""
+# Custom CSS for the whole app, page-specific rules included, so every rerun
+# sends a single style element instead of one per page section
+_GLOBAL_CSS = """
     <style>
     /* New color scheme */
     :root {
@@ -220,175 +304,379 @@ st.markdown("""
     tbody tr:nth-child(even) {
         background-color: rgba(42, 157, 143, 0.2) !important;
     }
+    
+    /* Button hover style */
+    .stButton button {
+        transition: color 0.3s;
+    }
+    .stButton button:hover {
+        color: black !important;
+    }
+    
+    /* Center print buttons */
+    div[data-testid="stButton"] {
+        text-align: center;
+    }
+    
+    /* Dive log form inputs; the dive log is the only form with .dive-form
+       sections, so other pages' inputs keep the default look */
+    [data-testid="stForm"]:has(.dive-form) .stTextInput,
+    [data-testid="stForm"]:has(.dive-form) .stNumberInput {
+        font-family: 'Courier New', monospace;
+    }
+    [data-testid="stForm"]:has(.dive-form) div[data-testid="stTextInput"] label,
+    [data-testid="stForm"]:has(.dive-form) div[data-testid="stNumberInput"] label {
+        color: var(--text) !important;
+        font-size: 1.1em !important;
+    }
+    /* Hide empty boxes */
+    [data-testid="stForm"]:has(.dive-form) [data-baseweb="input"] {
+        background-color: transparent !important;
+        border-color: transparent !important;
+    }
+    [data-testid="stForm"]:has(.dive-form) [data-baseweb="input"]:focus {
+        background-color: rgba(42, 157, 143, 0.2) !important;
+        border-color: #64FFDA !important;
+    }
+    
+    /* Rounded corners for the dive log chart */
+    .js-plotly-plot .plotly, .js-plotly-plot .plot-container {
+        border-radius: 15px !important;
+        overflow: hidden !important;
+    }
+    
+    /* Dive log download section */
+    .download-section {
+        text-align: center;
+        padding: 1rem;
+        margin: 2rem 0;
+        border: 2px solid var(--secondary);
+        border-radius: 15px;
+    }
+    
+    /* Make the weather map very tall; it is the app's only components.html
+       embed, so other iframes are left alone */
+    iframe[data-testid="stIFrame"] {
+        width: 100%;
+        min-height: 800px !important;
+        border: 2px solid var(--secondary);
+        border-radius: 15px;
+    }
+    
+    /* Home page instructions */
+    .home-content {
+        max-width: 800px;
+        margin: 0 auto;
+        padding: 2rem;
+        text-align: center;
+    }
+    .home-content h3 {
+        color: #264653;
+        margin-top: 2rem;
+        margin-bottom: 1.5rem;
+        font-size: 1.8rem;
+    }
+    .instruction-section {
+        background: rgba(42, 157, 143, 0.1);
+        border-radius: 10px;
+        padding: 1.5rem;
+        margin: 1rem 0;
+        text-align: left;
+    }
+    .instruction-section strong {
+        color: #2A9D8F;
+    }
+    .safety-notes {
+        background: rgba(230, 57, 70, 0.1);
+        border-radius: 10px;
+        padding: 1.5rem;
+        margin-top: 2rem;
+    }
+    .safety-notes h3 {
+        color: #E63946;
+    }
+    .safety-notes ul {
+        text-align: left;
+        list-style-position: inside;
+    }
     </style>
-""", unsafe_allow_html=True)
+"""
+
+# Apply custom CSS
+st.markdown(_GLOBAL_CSS, unsafe_allow_html=True)
 
-def load_dive_logs():
+def dive_logs_mtime():
+    # Modification time of the log file, used as the cache key for the loaders below.
+    # Only the current file is ever wanted, so each keeps a single entry and
+    # drops the old one when another process changes the file
     try:
-        with open("dive_logs.json", "r") as f:
-            logs = json.load(f)
-        return logs
+        return os.path.getmtime(DIVE_LOGS_FILE)
     except FileNotFoundError:
-        return []
+        return 0.0
 
-def dive_log_page():
-    st.title(" Log New Dive")
+# Cached on the file's mtime so reruns skip the JSON parse until save_dive_log writes
+@st.cache_data(show_spinner=False, max_entries=1)
+def load_dive_logs(mtime):
+    return read_dive_logs()
 
-    # Add custom CSS for input styling
-    st.markdown("""
-        <style>
-        .stTextInput, .stNumberInput {
-            font-family: 'Courier New', monospace;
-        }
-        div[data-testid="stTextInput"] label, div[data-testid="stNumberInput"] label {
-            color: var(--text) !important;
-            font-size: 1.1em !important;
-        }
-        /* Hide empty boxes */
-        [data-baseweb="input"] {
-            background-color: transparent !important;
-            border-color: transparent !important;
-        }
-        [data-baseweb="input"]:focus {
-            background-color: rgba(42, 157, 143, 0.2) !important;
-            border-color: #64FFDA !important;
-        }
-        </style>
-    """, unsafe_allow_html=True)
-    
-    # Header section with diver name prominently displayed
-    st.subheader("Diver Information")
-    diver_name = st.text_input("Diver Name", placeholder="Enter your full name")
+# Dive logs as a DataFrame with diver_name first and the bookkeeping columns dropped
+@st.cache_data(show_spinner=False, max_entries=1)
+def prepared_logs(mtime):
+    import pandas as pd
+    df = pd.DataFrame(load_dive_logs(mtime))
+    if df.empty:
+        return df
+    fixed = ['diver_name', 'dive_number', 'date', 'location']
+    rest = [col for col in df.columns if col not in fixed and col not in ('id', 'created_at')]
+    return df[fixed + rest]
+
+@st.cache_data(show_spinner=False, max_entries=1)
+def logs_csv(mtime):
+    return prepared_logs(mtime).to_csv(index=False).encode()
+
+# The figure is rebuilt only when the log file changes; callers must not mutate it
+@st.cache_resource(show_spinner=False, max_entries=1)
+def depth_figure(mtime):
+    # Streamlit already loads base plotly; plotly.express is only needed here, so
+    # it is imported on first use instead of at startup
+    import plotly.express as px
+
+    df = prepared_logs(mtime)
+
+    # Create visualization
+    fig = px.scatter(df, x='date', y='depth_max', 
+                    title='Maximum Depth Over Time',
+                    labels={'date': 'Date', 'depth_max': 'Maximum Depth (ft)'},
+                    color_discrete_sequence=['#64FFDA'])  # Light turquoise for points
     
-    st.markdown("<br>", unsafe_allow_html=True)  # Add spacing
+    fig.update_traces(marker=dict(
+        size=12,
+        line=dict(color='#2A9D8F', width=2)  # Teal outline
+    ))
     
-    # Rest of the form
-    st.subheader("Dive Details")
-    col1, col2, col3 = st.columns([1, 2, 1])
-    with col1:
-        dive_number = st.number_input("Dive #", min_value=1, value=1)
-    with col2:
-        date = st.date_input("Date")
-    with col3:
-        location = st.text_input("Location")
-    
-    # Create three main columns for the form
-    left_col, middle_col, right_col = st.columns([2, 1, 1])
-    
-    with left_col:
-        st.markdown('<div class="dive-form">', unsafe_allow_html=True)
-        # Depth and Time section
-        st.markdown('<div class="section-title">Depth & Time</div>', unsafe_allow_html=True)
-        depth_avg = st.number_input("Average Depth (ft)", min_value=0.0)
-        depth_max = st.number_input("Maximum Depth (ft)", min_value=0.0)
-        bottom_time = st.slider("Bottom Time (minutes)", min_value=0, max_value=120, value=30, step=5)
-        safety_stop = st.slider("Safety Stop Time (minutes)", min_value=0, max_value=10, value=3, step=1)
-        col1, col2, col3 = st.columns(3)
+    # Update layout for rounded corners and styling
+    fig.update_layout(
+        paper_bgcolor='rgba(0,0,0,0)',  # Transparent background
+        plot_bgcolor='rgba(14,17,23,0.5)',  # Semi-transparent dark background
+        title=dict(
+            text='Maximum Depth Over Time',
+            x=0.5,
+            y=0.95,
+            xanchor='center',
+            yanchor='top',
+            font=dict(size=24)
+        ),
+        margin=dict(t=70, l=50, r=30, b=50),  # Increased top margin for title
+        xaxis=dict(
+            showgrid=True,
+            gridcolor='rgba(42,157,143,0.1)',
+            showline=True,
+            linewidth=2,
+            linecolor='#2A9D8F'
+        ),
+        yaxis=dict(
+            showgrid=True,
+            gridcolor='rgba(42,157,143,0.1)',
+            showline=True,
+            linewidth=2,
+            linecolor='#2A9D8F'
+        )
+    )
+    return fig
+
+# A second save within the filesystem's timestamp resolution leaves the mtime
+# unchanged, so saves also drop the cached views explicitly
+def clear_dive_log_caches():
+    for cached in (load_dive_logs, prepared_logs, logs_csv, depth_figure):
+        cached.clear()
+
+# One journal store per process; it re-reads its file when another process
+# has appended to it
+@st.cache_resource
+def get_journal():
+    from dive_journal import DiveJournal
+    return DiveJournal()
+
+def journals_mtime():
+    # Modification time of the journal file, used as the cache key for the
+    # single-entry loaders below
+    try:
+        return os.path.getmtime(get_journal().file_path)
+    except FileNotFoundError:
+        return 0.0
+
+@st.cache_data(show_spinner=False, max_entries=1)
+def load_journals(mtime):
+    return get_journal().get_all_journals()
+
+# Sorted filter options for the journal list, collected in a single pass
+@st.cache_data(show_spinner=False, max_entries=1)
+def journal_facets(mtime):
+    locations, authors = set(), set()
+    for entry in load_journals(mtime):
+        locations.add(entry['location'])
+        authors.add(entry['author'])
+    return sorted(locations), sorted(authors)
+
+def clear_journal_caches():
+    for cached in (load_journals, journal_facets):
+        cached.clear()
+
+def dive_log_page():
+    st.title(" Log New Dive")
+    _dive_log_fragment()
+
+@_compat_fragment
+def _dive_log_fragment():
+    import pandas as pd
+
+    # All widgets live in one form so editing them does not rerun the page;
+    # values are only sent to the server when the log is saved
+    with st.form("dive_log_form", clear_on_submit=False):
+        # Header section with diver name prominently displayed
+        st.subheader("Diver Information")
+        diver_name = st.text_input("Diver Name", placeholder="Enter your full name")
+        
+        st.markdown("<br>", unsafe_allow_html=True)  # Add spacing
+        
+        # Rest of the form
+        st.subheader("Dive Details")
+        col1, col2, col3 = st.columns([1, 2, 1])
         with col1:
-            rnt = st.number_input("RNT", min_value=0)
+            dive_number = st.number_input("Dive #", min_value=1, value=1)
         with col2:
-            abt = st.number_input("ABT", min_value=0)
+            date = st.date_input("Date")
         with col3:
-            tbt = rnt + abt
-            st.metric("TBT", f"{tbt} min")
+            location = st.text_input("Location")
         
-        # Environment type selection
-        st.subheader("Environment")
-        col1, col2 = st.columns(2)
+        # Create three main columns for the form
+        left_col, middle_col, right_col = st.columns([2, 1, 1])
         
-        with col1:
-            st.write("Water Type")
-            fresh = st.checkbox("Fresh")
-            salt = st.checkbox("Salt")
-            deep = st.checkbox("Deep")
+        with left_col:
+            st.markdown('<div class="dive-form">', unsafe_allow_html=True)
+            # Depth and Time section
+            st.markdown('<div class="section-title">Depth & Time</div>', unsafe_allow_html=True)
+            depth_avg = st.number_input("Average Depth (ft)", min_value=0.0)
+            depth_max = st.number_input("Maximum Depth (ft)", min_value=0.0)
+            bottom_time = st.slider("Bottom Time (minutes)", min_value=0, max_value=120, value=30, step=5)
+            safety_stop = st.slider("Safety Stop Time (minutes)", min_value=0, max_value=10, value=3, step=1)
+            # The total bottom time is shown once the log is saved; inside a
+            # form it could only show the previous submission's total
+            col1, col2 = st.columns(2)
+            with col1:
+                rnt = st.number_input("RNT", min_value=0)
+            with col2:
+                abt = st.number_input("ABT", min_value=0)
         
-        with col2:
-            st.write("Entry Type")
-            shore = st.checkbox("Shore")
-            boat = st.checkbox("Boat")
-            night = st.checkbox("Night")
+            # Environment type selection
+            st.subheader("Environment")
+            col1, col2 = st.columns(2)
         
-        # Build the dive_type list from selections
-        dive_type = []
-        if fresh: dive_type.append("Fresh")
-        if salt: dive_type.append("Salt")
-        if deep: dive_type.append("Deep")
-        if shore: dive_type.append("Shore")
-        if boat: dive_type.append("Boat")
-        if night: dive_type.append("Night")
+            with col1:
+                st.write("Water Type")
+                fresh = st.checkbox("Fresh")
+                salt = st.checkbox("Salt")
+                deep = st.checkbox("Deep")
         
-        # Activities
-        st.subheader("Activities")
-        activities = st.multiselect("Select Activities", 
-            ["Recreation", "Wreck", "Reef", "Navigation", "Cave", "Search & Recovery", "Photography"],
-            default=None,
-            placeholder="Choose activities..."
-        )
-    
-    with middle_col:
-        st.markdown('<div class="dive-form">', unsafe_allow_html=True)
-        # Temperature
-        st.markdown('<div class="section-title">Temperature</div>', unsafe_allow_html=True)
-        temp_air = st.slider("Air Temperature (°F)", min_value=32, max_value=120, value=75)
-        temp_surface = st.slider("Surface Temperature (°F)", min_value=32, max_value=95, value=75)
-        temp_bottom = st.slider("Bottom Temperature (°F)", min_value=32, max_value=95, value=70)
+            with col2:
+                st.write("Entry Type")
+                shore = st.checkbox("Shore")
+                boat = st.checkbox("Boat")
+                night = st.checkbox("Night")
+        
+            # Build the dive_type list from selections
+            dive_type = [name for name, selected in (
+                ("Fresh", fresh), ("Salt", salt), ("Deep", deep),
+                ("Shore", shore), ("Boat", boat), ("Night", night)
+            ) if selected]
+        
+            # Activities
+            st.subheader("Activities")
+            activities = st.multiselect("Select Activities", 
+                _ACTIVITIES,
+                default=None,
+                placeholder="Choose activities..."
+            )
         
-        # Visibility
-        st.markdown('<div class="section-title">Visibility</div>', unsafe_allow_html=True)
-        visibility = st.number_input("Distance (ft)")
+        with middle_col:
+            st.markdown('<div class="dive-form">', unsafe_allow_html=True)
+            # Temperature
+            st.markdown('<div class="section-title">Temperature</div>', unsafe_allow_html=True)
+            temp_air = st.slider("Air Temperature (°F)", min_value=32, max_value=120, value=75)
+            temp_surface = st.slider("Surface Temperature (°F)", min_value=32, max_value=95, value=75)
+            temp_bottom = st.slider("Bottom Temperature (°F)", min_value=32, max_value=95, value=70)
         
-        # Air
-        st.markdown('<div class="section-title">Air</div>', unsafe_allow_html=True)
-        air_start = st.number_input("Start (psi)")
-        air_end = st.number_input("End (psi)")
-        gas_type = st.radio("Gas Type", ["Air", "Nitrox"])
-        if gas_type == "Nitrox":
-            nitrox_percent = st.number_input("Nitrox %", min_value=21, max_value=40)
-        st.markdown('</div>', unsafe_allow_html=True)
-    
-    with right_col:
-        st.markdown('<div class="dive-form">', unsafe_allow_html=True)
-        # Weight
-        st.markdown('<div class="section-title">Weight</div>', unsafe_allow_html=True)
-        weight = st.number_input("Weight (lbs)")
+            # Visibility
+            st.markdown('<div class="section-title">Visibility</div>', unsafe_allow_html=True)
+            visibility = st.number_input("Distance (ft)")
         
-        weight_adj_type = st.radio("", ["⚖️", "➕", "➖"], horizontal=True, key="weight_adj_type", label_visibility="collapsed")
-        if weight_adj_type in ["➕", "➖"]:
+            # Air
+            st.markdown('<div class="section-title">Air</div>', unsafe_allow_html=True)
+            air_start = st.number_input("Start (psi)")
+            air_end = st.number_input("End (psi)")
+            gas_type = st.radio("Gas Type", ["Air", "Nitrox"])
+            nitrox_percent = st.number_input("Nitrox %", min_value=21, max_value=40, help="Only used for Nitrox")
+            st.markdown('</div>', unsafe_allow_html=True)
+        
+        with right_col:
+            st.markdown('<div class="dive-form">', unsafe_allow_html=True)
+            # Weight
+            st.markdown('<div class="section-title">Weight</div>', unsafe_allow_html=True)
+            weight = st.number_input("Weight (lbs)")
+        
+            weight_adj_type = st.radio("", ["⚖️", "➕", "➖"], horizontal=True, key="weight_adj_type", label_visibility="collapsed")
             weight_change = st.number_input("Change Amount (lbs)", min_value=0.0, value=0.0, step=0.5)
-            if weight_adj_type == "➕":
-                st.info(f"New weight will be: {weight + weight_change} lbs")
-            else:
-                st.info(f"New weight will be: {weight - weight_change} lbs")
         
-        # Exposure Protection
-        st.markdown('<div class="section-title">Exposure Protection</div>', unsafe_allow_html=True)
-        protection = {}
-        for item in ["Full", "Shorty", "Boots", "Hood", "Gloves"]:
-            col1, col2 = st.columns([2, 1])
-            with col1:
-                use_item = st.checkbox(item)
-            with col2:
-                if use_item:
-                    protection[item] = st.number_input(f"{item} (mm)", key=f"protection_{item}")
+            # Exposure Protection
+            st.markdown('<div class="section-title">Exposure Protection</div>', unsafe_allow_html=True)
+            # One table widget instead of a checkbox and thickness input per item
+            exposure = st.data_editor(
+                pd.DataFrame({
+                    "Item": _EXPOSURE_ITEMS,
+                    "Use": [False] * len(_EXPOSURE_ITEMS),
+                    "mm": [0.0] * len(_EXPOSURE_ITEMS)
+                }),
+                num_rows="fixed",
+                disabled=["Item"],
+                column_config={
+                    "mm": st.column_config.NumberColumn(min_value=0.0, required=True)
+                },
+                hide_index=True,
+                use_container_width=True,
+                key="exposure"
+            )
+        
+            # Equipment
+            st.markdown('<div class="section-title">Equipment</div>', unsafe_allow_html=True)
+            camera = st.checkbox("Camera")
+            computer = st.checkbox("Computer")
+            flashlight = st.checkbox("Flashlight")
         
-        # Equipment
-        st.markdown('<div class="section-title">Equipment</div>', unsafe_allow_html=True)
-        camera = st.checkbox("Camera")
-        computer = st.checkbox("Computer")
-        flashlight = st.checkbox("Flashlight")
+            # Verification
+            st.markdown('<div class="section-title">Verification</div>', unsafe_allow_html=True)
+            ver_type = st.selectbox("Type", _VERIFICATION_TYPES, key="ver_type")
+            cert_num = st.text_input("Certification #")
+            st.markdown('</div>', unsafe_allow_html=True)
         
-        # Verification
-        st.markdown('<div class="section-title">Verification</div>', unsafe_allow_html=True)
-        ver_type = st.selectbox("Type", ["Instructor", "Divemaster", "Buddy"], key="ver_type")
-        cert_num = st.text_input("Certification #")
-        st.markdown('</div>', unsafe_allow_html=True)
-    
-    # Save button
-    if st.button("Save Dive Log", use_container_width=True):
-        equipment = []
-        if camera: equipment.append("Camera")
-        if computer: equipment.append("Computer")
-        if flashlight: equipment.append("Flashlight")
+        # Save button
+        submitted = st.form_submit_button("Save Dive Log", use_container_width=True)
+    
+    if submitted:
+        tbt = rnt + abt
+        st.metric("TBT", f"{tbt} min")
+        if weight_adj_type == "➕":
+            st.info(f"New weight will be: {weight + weight_change} lbs")
+        elif weight_adj_type == "➖":
+            st.info(f"New weight will be: {weight - weight_change} lbs")
+        
+        # A cleared thickness cell comes back as NaN; record it as 0 mm
+        protection = {
+            row.Item: float(row.mm) if pd.notna(row.mm) else 0.0
+            for row in exposure.itertuples() if row.Use
+        }
+        equipment = [name for name, selected in (
+            ("Camera", camera), ("Computer", computer), ("Flashlight", flashlight)
+        ) if selected]
         
         dive_log = DiveLog(
             diver_name=diver_name,
@@ -420,140 +708,45 @@ def dive_log_page():
             nitrox_percentage=nitrox_percent if gas_type == "Nitrox" else None
         )
         save_dive_log(dive_log)
+        clear_dive_log_caches()
         st.success("Dive log saved successfully!")
 
 def view_logs_page():
     st.title(" View Dive Logs")
     
     # Load dive logs
-    df = pd.DataFrame(load_dive_logs())
+    mtime = dive_logs_mtime()
+    df = prepared_logs(mtime)
     
     if df.empty:
         st.warning("No dive logs found. Enter a dive log to view here.")
         return
     
-    # Create visualization
-    fig = px.scatter(df, x='date', y='depth_max', 
-                    title='Maximum Depth Over Time',
-                    labels={'date': 'Date', 'depth_max': 'Maximum Depth (ft)'},
-                    color_discrete_sequence=['#64FFDA'])  # Light turquoise for points
-    
-    fig.update_traces(marker=dict(
-        size=12,
-        line=dict(color='#2A9D8F', width=2)  # Teal outline
-    ))
-    
-    # Update layout for rounded corners and styling
-    fig.update_layout(
-        paper_bgcolor='rgba(0,0,0,0)',  # Transparent background
-        plot_bgcolor='rgba(14,17,23,0.5)',  # Semi-transparent dark background
-        title=dict(
-            text='Maximum Depth Over Time',
-            x=0.5,
-            y=0.95,
-            xanchor='center',
-            yanchor='top',
-            font=dict(size=24)
-        ),
-        margin=dict(t=70, l=50, r=30, b=50),  # Increased top margin for title
-        xaxis=dict(
-            showgrid=True,
-            gridcolor='rgba(42,157,143,0.1)',
-            showline=True,
-            linewidth=2,
-            linecolor='#2A9D8F'
-        ),
-        yaxis=dict(
-            showgrid=True,
-            gridcolor='rgba(42,157,143,0.1)',
-            showline=True,
-            linewidth=2,
-            linecolor='#2A9D8F'
-        )
-    )
-    
-    # Add custom CSS for rounded corners
-    st.markdown("""
-        <style>
-        .js-plotly-plot .plotly, .js-plotly-plot .plot-container {
-            border-radius: 15px !important;
-            overflow: hidden !important;
-        }
-        </style>
-    """, unsafe_allow_html=True)
-    
     # Display the graph
-    st.plotly_chart(fig, use_container_width=True)
-    
-    # Prepare data for download
-    # Reorder columns to show diver_name first
-    columns = ['diver_name', 'dive_number', 'date', 'location'] + [col for col in df.columns if col not in ['diver_name', 'dive_number', 'date', 'location', 'id', 'created_at']]
-    df = df[columns]
-    
-    # Add custom download button CSS
-    st.markdown("""
-        <style>
-        /* Make all links white */
-        .download-section a {
-            color: var(--text) !important;
-            text-decoration: none !important;
-        }
-        
-        .download-section a:hover {
-            color: var(--primary) !important;
-        }
-        
-        .download-button {
-            background-color: var(--secondary);
-            color: var(--text);
-            padding: 0.75rem 1.5rem;
-            border-radius: 20px;
-            border: none;
-            font-family: 'Courier New', monospace !important;
-            font-size: 1rem;
-            cursor: pointer;
-            transition: all 0.3s ease;
-            display: block;
-            text-align: center;
-            text-decoration: none;
-            margin: 1rem auto;
-            width: fit-content;
-            min-width: 300px;
-        }
-        
-        .download-button:hover {
-            background-color: var(--accent);
-            color: var(--primary) !important;
-        }
-        
-        .download-section {
-            text-align: center;
-            padding: 1rem;
-            margin: 2rem 0;
-            border: 2px solid var(--secondary);
-            border-radius: 15px;
-        }
-        </style>
-    """, unsafe_allow_html=True)
+    st.plotly_chart(depth_figure(mtime), use_container_width=True)
+    _logs_download_fragment(mtime)
 
+# Clicking the download button reruns only this section, not the chart above
+@_compat_fragment
+def _logs_download_fragment(mtime):
     # Create download section
     st.markdown('<div class="download-section">', unsafe_allow_html=True)
     
-    # Convert dataframe to CSV
-    csv = df.to_csv(index=False)
-    b64 = base64.b64encode(csv.encode()).decode()
-    
-    # Create download link with custom styling
-    href = f'<a href="data:file/csv;base64,{b64}" download="dive_logs.csv" class="download-button"> Download Dive Logs CSV </a>'
-    st.markdown(href, unsafe_allow_html=True)
+    st.download_button(
+        "Download Dive Logs CSV",
+        data=logs_csv(mtime),
+        file_name="dive_logs.csv",
+        mime="text/csv",
+        use_container_width=True
+    )
     st.markdown('</div>', unsafe_allow_html=True)
 
 def dive_planner_page():
     st.title(" PADI Dive Planner")
-    
-    # Get available depths from the dive tables
-    available_depths = sorted(list(no_deco_limits.keys()))
-    
+    _dive_planner_fragment()
+
+@_compat_fragment
+def _dive_planner_fragment():
     # First Dive
     st.header('First Dive')
     col1, col2 = st.columns(2)
@@ -561,7 +754,7 @@ def dive_planner_page():
     with col1:
         depth1 = st.selectbox(
             'First Dive Depth (ft)',
-            available_depths,
+            AVAILABLE_DEPTHS,
             format_func=lambda x: f'{x} ft'
         )
     
@@ -603,7 +796,7 @@ def dive_planner_page():
     with col3:
         depth2 = st.selectbox(
             'Second Dive Depth (ft)',
-            available_depths,
+            AVAILABLE_DEPTHS,
             format_func=lambda x: f"{x} ft"
         )
     
@@ -673,9 +866,18 @@ def dive_planner_page():
         </div>
     """, unsafe_allow_html=True)
 
+# The calculator only holds fixed guideline tables, so one instance serves every click
+@st.cache_resource
+def get_travel_calculator():
+    from dive_travel import DiveTravelCalculator
+    return DiveTravelCalculator()
+
 def travel_planner_page():
     st.title(" Dive Travel Planner")
-    
+    _travel_planner_fragment()
+
+@_compat_fragment
+def _travel_planner_fragment():
     st.markdown('<div class="dive-form">', unsafe_allow_html=True)
     st.markdown('<div class="section-title">Flight Details</div>', unsafe_allow_html=True)
     
@@ -693,11 +895,9 @@ def travel_planner_page():
     with col4:
         last_dive_time = st.time_input("Last Dive Time")
     
-    # Common diving depths
-    depths = [10, 15, 20, 25, 30, 35, 40, 50, 60, 70, 80, 90, 100, 110, 120, 130]
     last_dive_depth = st.selectbox(
         "Last Dive Depth",
-        depths,
+        _TRAVEL_DEPTHS,
         format_func=lambda x: f"{x} ft"
     )
     
@@ -705,7 +905,7 @@ def travel_planner_page():
     repetitive_dives = st.checkbox("Multiple dives within 24 hours")
     
     if st.button("Check Safety", use_container_width=True):
-        calculator = DiveTravelCalculator()
+        calculator = get_travel_calculator()
         last_dive = datetime.combine(last_dive_date, last_dive_time)
         flight_datetime = datetime.combine(flight_date, flight_time)
         
@@ -744,28 +944,8 @@ def weather_page():
             Data provided by Windy.com
         """)
         
-        # Set the map to be very tall
-        st.markdown("""
-            <style>
-            iframe {
-                width: 100%;
-                min-height: 800px !important;
-                border: 2px solid var(--secondary);
-                border-radius: 15px;
-            }
-            </style>
-        """, unsafe_allow_html=True)
-        
         # Embed Windy map using HTML iframe
-        windy_html = f"""
-            <div style="height: 800px;">
-                <iframe 
-                    src="https://embed.windy.com/embed2.html?lat=25.000&lon=-80.000&zoom=5&level=surface&overlay=wind&menu=&message=&marker=&calendar=&pressure=&type=map&location=coordinates&detail=&detailLat=25.000&detailLon=-80.000&metricWind=default&metricTemp=default&radarRange=-1"
-                    style="width: 100%; height: 100%; border: none;">
-                </iframe>
-            </div>
-        """
-        st.components.v1.html(windy_html, height=800)
+        components.html(_WINDY_HTML, height=800)
     
     # Add some spacing between map and text
     st.markdown("<br><br>", unsafe_allow_html=True)
@@ -791,9 +971,11 @@ def weather_page():
 
 def journal_entry_page():
     st.title(" Dive Journal")
-    
-    # Initialize journal
-    journal = DiveJournal()
+    _journal_entry_fragment()
+
+@_compat_fragment
+def _journal_entry_fragment():
+    journal = get_journal()
     
     with st.form("journal_entry", clear_on_submit=True):
         st.markdown('<div class="section-title">New Journal Entry</div>', unsafe_allow_html=True)
@@ -837,6 +1019,7 @@ def journal_entry_page():
             }
             
             if journal.save_journal(entry, uploaded_file):
+                clear_journal_caches()
                 st.success("Journal entry saved successfully! ")
             else:
                 st.error("Failed to save journal entry.")
@@ -844,207 +1027,90 @@ def journal_entry_page():
 def view_journals_page():
     st.title(" My Dive Journals")
     
-    journal = DiveJournal()
-    entries = journal.get_all_journals()
+    mtime = journals_mtime()
+    entries = load_journals(mtime)
     
     if not entries:
         st.info("No journal entries yet. Start writing about your dive experiences!")
         return
     
+    _render_entries(entries, mtime)
+
+# Changing a filter or opening another entry reruns only the list below
+@_compat_fragment
+def _render_entries(entries, mtime):
+    import pandas as pd
+
     # Filters
     col1, col2 = st.columns(2)
+    locations, authors = journal_facets(mtime)
     with col1:
         location_filter = st.multiselect(
             "Filter by Location",
-            options=sorted(set(e['location'] for e in entries))
+            options=locations
         )
     with col2:
         author_filter = st.multiselect(
             "Filter by Diver",
-            options=sorted(set(e['author'] for e in entries))
+            options=authors
         )
     
-    # Apply filters
-    filtered_entries = entries
-    if location_filter:
-        filtered_entries = [e for e in filtered_entries if e['location'] in location_filter]
-    if author_filter:
-        filtered_entries = [e for e in filtered_entries if e['author'] in author_filter]
-    
-    # Display entries
-    for entry in filtered_entries:
-        with st.expander(f"{entry['title']} - {entry['date'][:10]} ({entry['location']})"):
-            # Display photo if available
-            if entry.get('image_path'):
-                st.image(entry['image_path'])
-            
-            col1, col2, col3, col4 = st.columns([2,1,1,1])
-            with col1:
-                st.write(f"**Location:** {entry['location']}")
-            with col2:
-                st.write(f"**Author:** {entry['author']}")
-            with col3:
-                st.write(f"**Mood:** {entry['mood']}")
-            with col4:
-                st.write(f"**Rating:** {'*' * entry['rating']}")
-            
-            st.write(entry['content'])
+    # Apply both filters in one pass; an empty selection matches everything
+    locset = frozenset(location_filter) if location_filter else None
+    authset = frozenset(author_filter) if author_filter else None
+    filtered_entries = [
+        e for e in entries
+        if (locset is None or e['location'] in locset) and (authset is None or e['author'] in authset)
+    ]
+    
+    if not filtered_entries:
+        st.info("No journal entries match the selected filters.")
+        return
+    
+    # Overview of all matching entries as a single table element
+    entries_df = pd.DataFrame(filtered_entries, columns=['date', 'location', 'author', 'title', 'rating', 'mood'])
+    st.dataframe(entries_df, use_container_width=True, hide_index=True)
+    
+    # Only the selected entry is rendered in full, with its photo
+    selected = st.selectbox(
+        "Open entry",
+        range(len(filtered_entries)),
+        format_func=lambda i: f"{filtered_entries[i]['title']} - {filtered_entries[i]['date'][:10]} ({filtered_entries[i]['location']})"
+    )
+    entry = filtered_entries[selected]
+    with st.expander(f"{entry['title']} - {entry['date'][:10]} ({entry['location']})", expanded=True):
+        # Display photo if available
+        # Photos live under ./static, so the browser loads them from the static
+        # file route (and its cache) instead of receiving the bytes on each rerun
+        if entry.get('image_path'):
+            st.markdown(
+                f'<img src="./app/{entry["image_path"]}" loading="lazy" width="100%">',
+                unsafe_allow_html=True
+            )
+        
+        # Entry details on one line: a single element instead of four columns.
+        # These fields are user-entered, so no raw HTML here; &nbsp; is a
+        # markdown entity and renders without it
+        st.markdown(
+            f"**Location:** {entry['location']} &nbsp;&nbsp; "
+            f"**Author:** {entry['author']} &nbsp;&nbsp; "
+            f"**Mood:** {entry['mood']} &nbsp;&nbsp; "
+            f"**Rating:** {'★' * entry['rating']}"
+        )
+        
+        st.write(entry['content'])
 
 def home_page():
-    # Add custom CSS for the home page
-    st.markdown("""
-        <style>
-        .home-content {
-            max-width: 800px;
-            margin: 0 auto;
-            padding: 2rem;
-            text-align: center;
-        }
-        .home-content h3 {
-            color: #264653;
-            margin-top: 2rem;
-            margin-bottom: 1.5rem;
-            font-size: 1.8rem;
-        }
-        .instruction-section {
-            background: rgba(42, 157, 143, 0.1);
-            border-radius: 10px;
-            padding: 1.5rem;
-            margin: 1rem 0;
-            text-align: left;
-        }
-        .instruction-section strong {
-            color: #2A9D8F;
-        }
-        .safety-notes {
-            background: rgba(230, 57, 70, 0.1);
-            border-radius: 10px;
-            padding: 1.5rem;
-            margin-top: 2rem;
-        }
-        .safety-notes h3 {
-            color: #E63946;
-        }
-        .safety-notes ul {
-            text-align: left;
-            list-style-position: inside;
-        }
-        </style>
-    """, unsafe_allow_html=True)
-
     # Title using Streamlit's native title
     st.title("Scuba Diving Assistant Instructions")
-    
-    # Main content container
-    st.markdown('<div class="home-content">', unsafe_allow_html=True)
-    
-    # How to Use section
-    st.markdown('<h3>How to Use This Application</h3>', unsafe_allow_html=True)
-    
-    # 1. Logging a New Dive
-    with st.container():
-        st.markdown("""
-            <div class="instruction-section">
-                <strong>1. Logging a New Dive</strong>
-                <ul>
-                    <li>Click "Log New Dive" in the sidebar</li>
-                    <li>Fill in dive details (date, location, depth, duration)</li>
-                    <li>Add any buddy information and personal notes</li>
-                    <li>Click "Save Dive Log" to store your entry</li>
-                </ul>
-            </div>
-        """, unsafe_allow_html=True)
-    
-    # 2. Viewing Dive History
-    with st.container():
-        st.markdown("""
-            <div class="instruction-section">
-                <strong>2. Viewing Your Dive History</strong>
-                <ul>
-                    <li>Select "View Dive Logs" from the sidebar</li>
-                    <li>Browse through your past dives</li>
-                    <li>Use filters to find specific dives</li>
-                    <li>Export logs if needed</li>
-                </ul>
-            </div>
-        """, unsafe_allow_html=True)
-    
-    # 3. Planning Next Dive
-    with st.container():
-        st.markdown("""
-            <div class="instruction-section">
-                <strong>3. Planning Your Next Dive</strong>
-                <ul>
-                    <li>Go to "Dive Planner"</li>
-                    <li>Enter your planned depth and time</li>
-                    <li>The planner will calculate your pressure group</li>
-                    <li>For repetitive dives, enter surface interval to get adjusted times</li>
-                </ul>
-            </div>
-        """, unsafe_allow_html=True)
-    
-    # 4. Travel Planning
-    with st.container():
-        st.markdown("""
-            <div class="instruction-section">
-                <strong>4. Travel Planning</strong>
-                <ul>
-                    <li>Use "Travel Planner" for trip organization</li>
-                    <li>Input destination and dates</li>
-                    <li>Track equipment and documentation needs</li>
-                </ul>
-            </div>
-        """, unsafe_allow_html=True)
-    
-    # 5. Weather Check
-    with st.container():
-        st.markdown("""
-            <div class="instruction-section">
-                <strong>5. Weather Check</strong>
-                <ul>
-                    <li>Check "Weather & Conditions" before your dive</li>
-                    <li>View current conditions at dive sites</li>
-                    <li>Make informed decisions about dive timing</li>
-                </ul>
-            </div>
-        """, unsafe_allow_html=True)
-    
-    # 6. Keeping a Dive Journal
-    with st.container():
-        st.markdown("""
-            <div class="instruction-section">
-                <strong>6. Keeping a Dive Journal</strong>
-                <ul>
-                    <li>Select "Write Journal" to write about your experiences</li>
-                    <li>Add detailed observations and memories</li>
-                    <li>View past entries in "My Journals"</li>
-                </ul>
-            </div>
-        """, unsafe_allow_html=True)
-    
-    # Safety Notes
-    with st.container():
-        st.markdown("""
-            <div class="safety-notes">
-                <h3>Safety Notes</h3>
-                <ul>
-                    <li>Always follow safe diving practices</li>
-                    <li>Stay within no-decompression limits</li>
-                    <li>Plan your dives and dive your plan</li>
-                    <li>Never dive alone</li>
-                </ul>
-            </div>
-        """, unsafe_allow_html=True)
-    
-    st.markdown('</div>', unsafe_allow_html=True)
+    st.markdown(_HOME_HTML, unsafe_allow_html=True)
 
 def main():
     # Add tank logo to sidebar
-    tank_image = get_tank_image_base64()
     st.sidebar.markdown(f"""
         <div style='text-align: center; padding: 2rem 0; margin: 1rem 0;'>
             <a href="/" style='text-decoration: none;'>
-                <img src="{tank_image}" style='width: 150px; height: auto; margin-bottom: 1rem;' alt="Scuba Tank Logo">
+                <img src="{_TANK_IMAGE_URL}" style='width: 150px; height: auto; margin-bottom: 1rem;' alt="Scuba Tank Logo">
                 <div style='
                     font-family: "Marker Felt", "Comic Sans MS", cursive;
                     font-size: 32px;
@@ -1058,23 +1124,6 @@ def main():
         </div>
     """, unsafe_allow_html=True)
     
-    # Add global button hover style
-    st.markdown("""
-        <style>
-        .stButton button {
-            transition: color 0.3s;
-        }
-        .stButton button:hover {
-            color: black !important;
-        }
-        
-        /* Center print buttons */
-        div[data-testid="stButton"] {
-            text-align: center;
-        }
-        </style>
-    """, unsafe_allow_html=True)
-    
     # Set up navigation
     pages = {
         "Home": home_page,
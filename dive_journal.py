@@ -7,59 +7,100 @@ It provides functionality for creating, storing, and retrieving dive journal
 entries with associated metadata and images.
 
 Features:
-- JSON-based storage for dive journal entries
+- JSON Lines storage for dive journal entries (one entry per line, append-only)
 - Support for image attachments
 - Automatic timestamp management
-- Sorted retrieval of journal entries
+- Sorted retrieval of journal entries (kept newest first as they are added)
 """
 
-import json
 from datetime import datetime
 import os
+import secrets
 import shutil
+import threading
 from pathlib import Path
 
+from jsonl_store import append_record, migrate_legacy_array, read_records
+
+# Journal entries are stored one JSON object per line so a save only appends
+JOURNALS_FILE = "dive_journals.jsonl"
+# Earlier versions stored all entries as a single JSON array
+LEGACY_JOURNALS_FILE = "dive_journals.json"
+
+# Journal images are saved under ./static so the app can serve them by URL;
+# the directory is created once on import rather than per instance
+_IMAGE_DIR = Path("static/journal_images")
+_IMAGE_DIR.mkdir(parents=True, exist_ok=True)
+
 class DiveJournal:
     """
     A digital journal system for recording dive experiences and memories.
     
     This class manages the storage and retrieval of dive journal entries,
     including text content and associated images. All entries are stored
-    in a JSON file, with images saved to a dedicated directory.
+    in a JSON Lines file, with images saved to a dedicated directory.
     
     Attributes:
-        file_path (str): Path to the JSON file storing journal entries
+        file_path (str): Path to the JSON Lines file storing journal entries
         image_dir (Path): Directory path for storing journal images
     """
     
-    def __init__(self, file_path="dive_journals.json"):
+    def __init__(self, file_path=JOURNALS_FILE):
         """
         Initialize the dive journal system.
         
         Args:
-            file_path (str): Path to the JSON file for storing entries.
-                           Defaults to 'dive_journals.json'
+            file_path (str): Path to the JSON Lines file for storing entries.
+                           Defaults to 'dive_journals.jsonl'
         """
         self.file_path = file_path
-        self.journals = self._load_journals()
-        self.image_dir = Path("static/journal_images")
-        self.image_dir.mkdir(parents=True, exist_ok=True)
+        self.image_dir = _IMAGE_DIR
+        # The app shares one instance between sessions; saves and reloads run
+        # one at a time
+        self._lock = threading.Lock()
+        # Size and modification time of the file as last seen, so entries
+        # appended by another process are picked up when it changes
+        self._signature = self._file_signature()
+        # Kept newest first so retrieval never needs to sort
+        self.journals = sorted(self._load_journals(), key=lambda x: x['timestamp'], reverse=True)
 
     def _load_journals(self):
         """
-        Load journal entries from the JSON file.
+        Load journal entries from the JSON Lines file.
         
         Returns:
             list: List of journal entries. Returns empty list if file doesn't
-                 exist or is corrupted.
+                 exist; damaged lines are skipped as described in
+                 jsonl_store.read_records.
         """
-        if os.path.exists(self.file_path):
-            try:
-                with open(self.file_path, 'r') as f:
-                    return json.load(f)
-            except json.JSONDecodeError:
-                return []
-        return []
+        # A legacy JSON array file is converted only for the default path
+        if self.file_path == JOURNALS_FILE:
+            migrate_legacy_array(LEGACY_JOURNALS_FILE, self.file_path)
+        return read_records(self.file_path)
+
+    def _file_signature(self):
+        """
+        Get the journal file's modification time and size.
+        
+        Returns:
+            Optional[tuple]: (mtime_ns, size), or None if the file doesn't exist
+        """
+        try:
+            stat = os.stat(self.file_path)
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def _refresh(self):
+        """
+        Reload the entries if the journal file changed since it was last seen.
+        
+        Internal method; the caller must hold the lock.
+        """
+        signature = self._file_signature()
+        if signature != self._signature:
+            self._signature = signature
+            self.journals = sorted(self._load_journals(), key=lambda x: x['timestamp'], reverse=True)
 
     def save_journal(self, entry, image_file=None):
         """
@@ -74,46 +115,74 @@ class DiveJournal:
             
         Note:
             The image file is expected to be a Streamlit UploadedFile object
-            or similar that provides .name and .getvalue() attributes.
+            or similar file-like object that provides .name, .seek() and .read().
         """
-        entry['timestamp'] = datetime.now().isoformat()
+        now = datetime.now()
+        entry['timestamp'] = now.isoformat()
         
         # Handle image upload if provided
         if image_file is not None:
-            # Create a unique filename based on timestamp
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            image_filename = f"journal_image_{timestamp}{Path(image_file.name).suffix}"
+            # Create a unique filename based on the entry's timestamp; the random
+            # suffix keeps two uploads in the same second from overwriting each other
+            timestamp = now.strftime("%Y%m%d_%H%M%S")
+            image_filename = f"journal_image_{timestamp}_{secrets.token_hex(3)}{Path(image_file.name).suffix}"
             image_path = self.image_dir / image_filename
             
-            # Save the image
+            # Save the image, copying in 1 MiB chunks rather than one full buffer
+            image_file.seek(0)
             with open(image_path, "wb") as f:
-                f.write(image_file.getvalue())
+                shutil.copyfileobj(image_file, f, 1024 * 1024)
             
             # Store the image path in the entry
-            entry['image_path'] = f"static/journal_images/{image_filename}"
+            entry['image_path'] = image_path.as_posix()
         else:
             entry['image_path'] = None
         
-        self.journals.append(entry)
-        self._save_to_file()
+        # New entries almost always belong at the front; skip past any
+        # stored with a later timestamp (e.g. after a clock change)
+        with self._lock:
+            self._refresh()
+            index = 0
+            while index < len(self.journals) and self.journals[index]['timestamp'] > entry['timestamp']:
+                index += 1
+            self.journals.insert(index, entry)
+            size_before = self._signature[1] if self._signature else 0
+            written = self._save_to_file(entry)
+            # Our own line is already in memory, so the file only counts as
+            # seen if it grew by exactly that line; anything another process
+            # appended meanwhile is picked up by the next refresh
+            signature = self._file_signature()
+            if signature is not None and signature[1] == size_before + written:
+                self._signature = signature
         return True
 
     def get_all_journals(self):
         """
         Get all journal entries sorted by date.
         
+        Entries appended to the file by another process since the last call
+        are loaded first.
+        
         Returns:
             list: List of journal entries sorted by timestamp in descending order
-                 (newest first)
+                 (newest first). This is the journal's own list, so callers
+                 should not modify it.
         """
-        return sorted(self.journals, key=lambda x: x['timestamp'], reverse=True)
+        with self._lock:
+            self._refresh()
+            return self.journals
 
-    def _save_to_file(self):
+    def _save_to_file(self, entry):
         """
-        Save journals to file.
+        Append a journal entry to file.
         
-        Internal method to write the current state of journal entries to
-        the JSON file with proper formatting.
+        Internal method to write a single new entry as one line at the end
+        of the JSON Lines file, leaving existing entries untouched.
+        
+        Args:
+            entry (dict): Journal entry to append
+        
+        Returns:
+            int: Number of bytes written
         """
-        with open(self.file_path, 'w') as f:
-            json.dump(self.journals, f, indent=2)
+        return append_record(self.file_path, entry)
@@ -4,7 +4,7 @@ Dive Log Management System
 This module provides a comprehensive system for creating, storing, and managing scuba diving logs.
 It includes functionality for:
 - Creating detailed dive log entries with extensive metadata
-- Storing dive logs in a JSON file
+- Storing dive logs in a JSON Lines file (one log per line, append-only)
 - Loading and displaying dive log history
 - Tracking various dive parameters including:
   * Depth and time information
@@ -15,14 +15,25 @@ It includes functionality for:
   * Verification details
 """
 
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, fields
 from datetime import datetime
-from typing import List, Optional, Dict, Any
-import json
-import os
+from typing import List, Optional, Dict, Any, Union
+import threading
 import uuid
 
-@dataclass
+from jsonl_store import append_record, decode_line, encode_line, migrate_legacy_array, read_records
+
+# Dive logs are stored one JSON object per line so a save only appends
+DIVE_LOGS_FILE = "dive_logs.jsonl"
+# Earlier versions stored all logs as a single JSON array
+LEGACY_DIVE_LOGS_FILE = "dive_logs.json"
+
+# Set once the log file has been brought up to date in this process; the lock
+# keeps concurrent first loads (one per app session thread) from both running it
+_migrated = False
+_migrate_lock = threading.Lock()
+
+@dataclass(slots=True)
 class DiveLog:
     """
     A comprehensive dive log entry containing all relevant information about a dive.
@@ -106,14 +117,15 @@ class DiveLog:
         Returns:
             Dict[str, Any]: Dictionary representation of the dive log
         """
-        data = asdict(self)
-        if 'id' in data:
-            id_value = data.pop('id')
-            data = {'id': id_value, **data}
-        if 'created_at' in data:
-            created_at_value = data.pop('created_at')
-            data = {'created_at': created_at_value, **data}
-        return data
+        # Fields are read directly rather than through asdict, which deep-copies
+        # every list and dict only for them to be serialized straight away
+        return {name: getattr(self, name) for name in _DIVELOG_FIELDS}
+
+# Serialized key order for DiveLog: created_at and id first, then the rest in
+# declaration order
+_DIVELOG_FIELDS = ('created_at', 'id') + tuple(
+    f.name for f in fields(DiveLog) if f.name not in ('id', 'created_at')
+)
 
 def get_dive_log_input() -> DiveLog:
     """
@@ -234,110 +246,166 @@ def get_dive_log_input() -> DiveLog:
         certification_number=cert_num
     )
 
-def save_dive_log(dive_log: DiveLog) -> None:
+def _migrate_once() -> None:
     """
-    Save dive log to JSON file.
+    Bring the log file up to date once per process.
     
-    Args:
-        dive_log (DiveLog): The dive log to save
+    Converts a legacy JSON array file and backfills ids and creation times on
+    logs written before those fields existed. Logs saved through DiveLog
+    always carry both, so later loads are plain reads.
+    """
+    global _migrated
+    if _migrated:
+        return
+    with _migrate_lock:
+        if _migrated:
+            return
+        migrate_legacy_array(LEGACY_DIVE_LOGS_FILE, DIVE_LOGS_FILE)
+        _backfill_missing_fields()
+        _migrated = True
+
+def _backfill_missing_fields() -> None:
+    """
+    Add an id and creation time to any stored log missing them.
+    
+    The file is rewritten only if at least one log was updated.
     """
     try:
-        with open("dive_logs.json", "r") as f:
-            logs = json.load(f)
-            # Update existing logs with IDs if they don't have them
-            for log in logs:
-                if 'id' not in log:
-                    log['id'] = str(uuid.uuid4())
-                if 'created_at' not in log:
-                    log['created_at'] = datetime.now().isoformat()
-    except (FileNotFoundError, json.JSONDecodeError):
-        logs = []
+        with open(DIVE_LOGS_FILE, "rb") as f:
+            lines = [line for line in f if line.strip()]
+    except FileNotFoundError:
+        return
     
-    # Add the new log
-    logs.append(dive_log.to_dict())
+    # Update logs with missing IDs; one creation time serves the whole pass.
+    # Lines that do not decode are written back exactly as they were
+    modified = False
+    now_iso = datetime.now().isoformat()
+    logs = []
+    for line in lines:
+        try:
+            log = decode_line(line)
+        except ValueError:
+            log = None
+        if not isinstance(log, dict):
+            logs.append(line if line.endswith(b"\n") else line + b"\n")
+            continue
+        logs.append(log)
+        if 'id' not in log:
+            log['id'] = str(uuid.uuid4())
+            modified = True
+        if 'created_at' not in log:
+            log['created_at'] = now_iso
+            modified = True
     
-    with open("dive_logs.json", "w") as f:
-        json.dump(logs, f, indent=2)
+    # Save if we had to add any IDs
+    if modified:
+        _write_dive_logs(logs)
 
-def load_dive_logs() -> List[Dict[str, Any]]:
+def _write_dive_logs(logs: List[Union[Dict[str, Any], bytes]]) -> None:
     """
-    Load dive logs from JSON file.
+    Rewrite the whole log file with the given logs.
     
-    Returns:
-        List[Dict[str, Any]]: List of dive logs
+    Args:
+        logs (List[Union[Dict[str, Any], bytes]]): Dive logs to write, one per
+            line; bytes are written as they are
     """
-    try:
-        with open("dive_logs.json", "r") as f:
-            logs = json.load(f)
-            # Update logs with missing IDs
-            modified = False
-            for log in logs:
-                if 'id' not in log:
-                    log['id'] = str(uuid.uuid4())
-                    modified = True
-                if 'created_at' not in log:
-                    log['created_at'] = datetime.now().isoformat()
-                    modified = True
-            
-            # Save if we had to add any IDs
-            if modified:
-                with open("dive_logs.json", "w") as f:
-                    json.dump(logs, f, indent=2)
-            return logs
-    except (FileNotFoundError, json.JSONDecodeError):
-        return []
+    with open(DIVE_LOGS_FILE, "wb") as f:
+        for log in logs:
+            f.write(log if isinstance(log, bytes) else encode_line(log))
 
-def print_dive_log(dive_log: DiveLog) -> None:
+def save_dive_log(dive_log: DiveLog) -> None:
     """
-    Print formatted dive log report.
+    Append dive log to the JSON Lines file.
     
     Args:
-        dive_log (DiveLog): The dive log to print
+        dive_log (DiveLog): The dive log to save
     """
-    print("\n" + "="*50)
-    print(f"DIVE LOG REPORT #{dive_log.dive_number} - {dive_log.diver_name}")
-    print("="*50)
-    
-    print(f"\nDate: {dive_log.date}")
-    print(f"Location: {dive_log.location}")
+    _migrate_once()
+    append_record(DIVE_LOGS_FILE, dive_log.to_dict())
+
+def load_dive_logs() -> List[Dict[str, Any]]:
+    """
+    Load dive logs from the JSON Lines file.
     
-    print("\nDEPTH & TIME")
-    print(f"Average Depth: {dive_log.depth_avg} ft")
-    print(f"Maximum Depth: {dive_log.depth_max} ft")
-    print(f"Bottom Time: {dive_log.bottom_time} mins")
-    print(f"Safety Stop: {dive_log.safety_stop_time} mins")
-    print(f"Total Bottom Time: {dive_log.tbt} mins (RNT: {dive_log.rnt} + ABT: {dive_log.abt})")
+    Damaged lines are skipped as described in jsonl_store.read_records.
     
-    print("\nENVIRONMENT")
-    print(f"Type: {', '.join(dive_log.dive_type)}")
-    print(f"Activities: {', '.join(dive_log.activities)}")
+    Returns:
+        List[Dict[str, Any]]: List of dive logs
+    """
+    _migrate_once()
+    return read_records(DIVE_LOGS_FILE)
+
+def format_dive_log(dive_log: DiveLog) -> str:
+    """
+    Build the formatted dive log report as a single string.
     
-    print("\nCONDITIONS")
-    print(f"Temperature - Air: {dive_log.temperature_air}°F")
-    print(f"Temperature - Surface: {dive_log.temperature_surface}°F")
-    print(f"Temperature - Bottom: {dive_log.temperature_bottom}°F")
-    print(f"Visibility: {dive_log.visibility_ft} ft")
+    Args:
+        dive_log (DiveLog): The dive log to format
     
-    print("\nAIR/GAS")
-    print(f"Start Pressure: {dive_log.air_start_psi} psi")
-    print(f"End Pressure: {dive_log.air_end_psi} psi")
-    print(f"Gas Type: {dive_log.gas_type}")
+    Returns:
+        str: The full report, ready to print
+    """
+    rule = "="*50
+    lines = [
+        "\n" + rule,
+        f"DIVE LOG REPORT #{dive_log.dive_number} - {dive_log.diver_name}",
+        rule,
+        
+        f"\nDate: {dive_log.date}",
+        f"Location: {dive_log.location}",
+        
+        "\nDEPTH & TIME",
+        f"Average Depth: {dive_log.depth_avg} ft",
+        f"Maximum Depth: {dive_log.depth_max} ft",
+        f"Bottom Time: {dive_log.bottom_time} mins",
+        f"Safety Stop: {dive_log.safety_stop_time} mins",
+        f"Total Bottom Time: {dive_log.tbt} mins (RNT: {dive_log.rnt} + ABT: {dive_log.abt})",
+        
+        "\nENVIRONMENT",
+        f"Type: {', '.join(dive_log.dive_type)}",
+        f"Activities: {', '.join(dive_log.activities)}",
+        
+        "\nCONDITIONS",
+        f"Temperature - Air: {dive_log.temperature_air}°F",
+        f"Temperature - Surface: {dive_log.temperature_surface}°F",
+        f"Temperature - Bottom: {dive_log.temperature_bottom}°F",
+        f"Visibility: {dive_log.visibility_ft} ft",
+        
+        "\nAIR/GAS",
+        f"Start Pressure: {dive_log.air_start_psi} psi",
+        f"End Pressure: {dive_log.air_end_psi} psi",
+        f"Gas Type: {dive_log.gas_type}",
+    ]
     if dive_log.nitrox_percentage:
-        print(f"Nitrox: {dive_log.nitrox_percentage}%")
+        lines.append(f"Nitrox: {dive_log.nitrox_percentage}%")
     
-    print("\nWEIGHT & PROTECTION")
-    print(f"Weight: {dive_log.weight_lbs} lbs ({dive_log.weight_adjustment})")
-    print("Protection:")
-    for item, thickness in dive_log.exposure_protection.items():
-        print(f"  - {item}: {thickness}mm")
+    lines += [
+        "\nWEIGHT & PROTECTION",
+        f"Weight: {dive_log.weight_lbs} lbs ({dive_log.weight_adjustment})",
+        "Protection:",
+    ]
+    lines += [f"  - {item}: {thickness}mm" for item, thickness in dive_log.exposure_protection.items()]
     
-    print("\nEQUIPMENT")
-    print(f"Used: {', '.join(dive_log.equipment_used)}")
+    lines += [
+        "\nEQUIPMENT",
+        f"Used: {', '.join(dive_log.equipment_used)}",
+        
+        "\nVERIFICATION",
+        f"Type: {dive_log.verification_type}",
+        f"Certification #: {dive_log.certification_number}",
+        "\n" + rule + "\n",
+    ]
+    return "\n".join(lines)
+
+def print_dive_log(dive_log: DiveLog) -> None:
+    """
+    Print formatted dive log report.
     
-    print("\nVERIFICATION")
-    print(f"Type: {dive_log.verification_type}")
-    print(f"Certification #: {dive_log.certification_number}")
-    print("\n" + "="*50 + "\n")
+    Args:
+        dive_log (DiveLog): The dive log to print
+    """
+    # One write for the whole report instead of one per line
+    print(format_dive_log(dive_log))
 
 def main() -> None:
     """
@@ -14,7 +14,10 @@ Pressure groups are represented by letters A-Z where:
 - Z represents the most nitrogen saturation
 """
 
-from typing import Tuple, Dict, Optional
+from bisect import bisect_left, bisect_right
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Tuple, Dict, List, Optional, Sequence
 
 # No-Decompression Limits Table (depth in feet : max bottom time in minutes)
 # These are the maximum allowable bottom times for a single dive at each depth
@@ -33,6 +36,12 @@ no_deco_limits = {
     130: 10,
     140: 8    # Deep dives require much shorter bottom times
 }
+# Read-only like the tables below: AVAILABLE_DEPTHS and the packed RNT rows
+# are derived from its depths
+no_deco_limits = MappingProxyType(no_deco_limits)
+
+# Table depths in ascending order, for callers that offer them as choices
+AVAILABLE_DEPTHS = tuple(sorted(no_deco_limits))
 
 # Pressure groups A-Z mapped to their numeric index (0-25)
 # Used for calculations involving pressure group progression
@@ -75,6 +84,14 @@ pressure_group_table = {
     130: [(3, 'A'), (4, 'B'), (5, 'C'), (6, 'D'), (7, 'E'), (8, 'F'), (9, 'G'), (10, 'H')],
     140: [(3, 'A'), (4, 'B'), (5, 'C'), (6, 'D'), (7, 'E'), (8, 'F')]
 }
+# The tables are read-only once defined: lookups use the derived copies built
+# below, which an in-place edit would silently leave out of date
+pressure_group_table = MappingProxyType({depth: tuple(rows) for depth, rows in pressure_group_table.items()})
+
+# The same table split per depth into ascending time limits and the matching
+# group letters, so a lookup is a binary search instead of a scan
+_PG_TIMES = {depth: tuple(t for t, _ in rows) for depth, rows in pressure_group_table.items()}
+_PG_GROUPS = {depth: ''.join(group for _, group in rows) for depth, rows in pressure_group_table.items()}
 
 # Residual Nitrogen Time Table (Table 3)
 # Format: (depth, pressure_group): residual_nitrogen_time
@@ -298,6 +315,20 @@ rnt_table = {
     (140, 'E'): 7,
     (140, 'F'): 8
 }
+rnt_table = MappingProxyType(rnt_table)
+
+# The same table packed into one flat byte string, a row of 26 groups per table
+# depth; combinations missing from the table stay 0 (every value is below 256)
+_DEPTH_INDEX = {depth: i for i, depth in enumerate(AVAILABLE_DEPTHS)}
+_GROUP_INDEX = {group: i for i, group in enumerate(PRESSURE_GROUPS)}
+
+def _build_rnt_rows() -> bytes:
+    rows = bytearray(len(AVAILABLE_DEPTHS) * len(PRESSURE_GROUPS))
+    for (depth, group), minutes in rnt_table.items():
+        rows[_DEPTH_INDEX[depth] * len(PRESSURE_GROUPS) + _GROUP_INDEX[group]] = minutes
+    return bytes(rows)
+
+_RNT_ROWS = _build_rnt_rows()
 
 # Surface Interval Credit Table (in minutes)
 # Format: (old_group, new_group): (min_time, max_time)
@@ -583,7 +614,23 @@ surface_interval_table = {
     ('B', 'A'): (0, float('inf')),
     ('A', 'A'): (0, float('inf'))
 }
-
+surface_interval_table = MappingProxyType(surface_interval_table)
+
+# The same table grouped by starting group into ranges sorted by their lower
+# bound: (min_times, max_times, new_groups). A group's ranges never overlap,
+# so the only candidate for an interval is the last range starting at or below it
+def _build_si_ranges() -> Dict[str, Tuple[tuple, tuple, tuple]]:
+    ranges = {}
+    for (old, new), (lo, hi) in sorted(surface_interval_table.items(), key=lambda item: item[1][0]):
+        mins, maxes, groups = ranges.setdefault(old, ([], [], []))
+        mins.append(lo)
+        maxes.append(hi)
+        groups.append(new)
+    return {old: tuple(map(tuple, columns)) for old, columns in ranges.items()}
+
+_SI_RANGES = _build_si_ranges()
+
+@lru_cache(maxsize=512)
 def get_pressure_group(depth: int, time: int) -> str:
     """
     Calculate the pressure group letter based on depth and bottom time.
@@ -595,14 +642,46 @@ def get_pressure_group(depth: int, time: int) -> str:
     Returns:
         str: Pressure group letter (A-Z) or empty string if no valid group found
     """
-    if depth not in pressure_group_table:
+    times = _PG_TIMES.get(depth)
+    if times is None:
         return ""
     
-    for t, group in pressure_group_table[depth]:
-        if time <= t:
-            return group
-    return ""
+    # First limit the bottom time fits within
+    i = bisect_left(times, time)
+    return _PG_GROUPS[depth][i] if i < len(times) else ""
 
+def get_pressure_groups(depths: Sequence[int], times: Sequence[int]) -> List[str]:
+    """
+    Calculate pressure groups for many dives at once.
+    
+    Equivalent to calling get_pressure_group for each (depth, time) pair, but
+    each table depth is resolved with a single numpy.searchsorted call, which
+    pays off when replaying a whole dive history.
+    
+    Args:
+        depths (Sequence[int]): Dive depths in feet
+        times (Sequence[int]): Bottom times in minutes, one per depth
+    
+    Returns:
+        List[str]: Pressure group letters, with empty strings where no valid
+            group exists
+    """
+    # numpy is only needed here, so importing this module stays cheap
+    import numpy as np
+    
+    depths = np.asarray(depths)
+    times = np.asarray(times)
+    groups = np.full(len(depths), "", dtype="<U1")
+    for depth, limits in _PG_TIMES.items():
+        mask = depths == depth
+        if not mask.any():
+            continue
+        # One extra "" entry catches times past the last limit
+        letters = np.array(list(_PG_GROUPS[depth]) + [""])
+        groups[mask] = letters[np.searchsorted(limits, times[mask], side="left")]
+    return groups.tolist()
+
+@lru_cache(maxsize=512)
 def get_new_group_after_surface_interval(old_group: str, surface_interval: int) -> str:
     """
     Calculate the new pressure group after a surface interval.
@@ -614,15 +693,14 @@ def get_new_group_after_surface_interval(old_group: str, surface_interval: int)
     Returns:
         str: New pressure group letter after surface interval
     """
-    if not old_group or old_group not in PRESSURE_GROUPS:
+    ranges = _SI_RANGES.get(old_group)
+    if ranges is None:
         return ""
     
-    for new_group in PRESSURE_GROUPS:
-        interval_key = (old_group, new_group)
-        if interval_key in surface_interval_table:
-            min_time, max_time = surface_interval_table[interval_key]
-            if min_time <= surface_interval <= max_time:
-                return new_group
+    mins, maxes, groups = ranges
+    i = bisect_right(mins, surface_interval) - 1
+    if i >= 0 and surface_interval <= maxes[i]:
+        return groups[i]
     return ""
 
 def get_rnt(pg: str, depth: int) -> int:
@@ -636,8 +714,11 @@ def get_rnt(pg: str, depth: int) -> int:
     Returns:
         int: Residual nitrogen time in minutes to add to actual bottom time
     """
-    key = (depth, pg)
-    return rnt_table.get(key, 0)
+    depth_index = _DEPTH_INDEX.get(depth)
+    group_index = _GROUP_INDEX.get(pg)
+    if depth_index is None or group_index is None:
+        return 0
+    return _RNT_ROWS[depth_index * len(PRESSURE_GROUPS) + group_index]
 
 def check_ndl(depth: int, tbt: int) -> bool:
     """
@@ -650,7 +731,8 @@ def check_ndl(depth: int, tbt: int) -> bool:
     Returns:
         bool: True if dive is within limits, False if decompression required
     """
-    return depth in no_deco_limits and tbt <= no_deco_limits[depth]
+    limit = no_deco_limits.get(depth)
+    return limit is not None and tbt <= limit
 
 def calculate_total_bottom_time(rnt: int, planned_time: int) -> int:
     """
@@ -12,8 +12,73 @@ Features:
 - Time-based calculations with datetime handling
 """
 
-from datetime import datetime, timedelta
-from typing import Tuple, Optional
+from dataclasses import dataclass
+from datetime import datetime
+from functools import lru_cache
+import re
+from types import MappingProxyType
+from typing import Callable, Tuple, Optional, Union
+
+# Verdict messages returned by is_safe_to_fly
+_FLIGHT_BEFORE_DIVE_MSG = "Error: Flight time is before dive time!"
+_SAFE_FMT = "✅ Safe to fly! You'll have {:.1f} hours of surface interval (minimum required: {} hours)"
+_UNSAFE_FMT = "⚠️ NOT safe to fly! You need {:.1f} more hours of surface interval"
+
+# Fixed blocks of CLI text, each printed with a single call
+_CLI_INTRO = (
+    "\n=== Dive Travel Safety Calculator ===\n\n"
+    "This calculator helps determine if it's safe to fly after diving based on\n"
+    "recommended surface intervals from major diving organizations.\n\n"
+    "Which organization's guidelines do you follow?\n"
+    "1. DAN (Divers Alert Network)\n"
+    "2. PADI (Professional Association of Diving Instructors)\n"
+    "3. NAUI (National Association of Underwater Instructors)"
+)
+_DCS_WARNING = (
+    "\n⚠️ WARNING: Flying too soon after diving increases your risk of\n"
+    "decompression sickness (DCS). Symptoms may include:\n"
+    "- Joint pain\n"
+    "- Numbness or tingling\n"
+    "- Dizziness\n"
+    "- Difficulty breathing\n"
+    "\nPlease follow the recommended surface interval guidelines\n"
+    "for your safety. Consider rebooking your flight if possible."
+)
+
+# Zero-padded "YYYY-MM-DD HH:MM", the format the CLI asks for
+_DATETIME_RE = re.compile(r"(\d{4})-(\d{2})-(\d{2}) (\d{2}):(\d{2})", re.ASCII)
+
+@dataclass(frozen=True, slots=True)
+class SafetyResult:
+    """
+    Outcome of a fly-after-diving check.
+    
+    The explanatory message is only formatted when it is asked for, so callers
+    that just need the verdict never build it.
+    
+    Attributes:
+        safe (bool): True if enough surface interval time will have passed
+        hours_until_flight (float): Surface interval before the flight in hours
+            (negative if the flight is before the dive)
+        required_hours (int): Minimum surface interval in hours
+    """
+    safe: bool
+    hours_until_flight: float
+    required_hours: int
+
+    @property
+    def hours_short(self) -> float:
+        """Hours of surface interval still needed (zero or negative if safe)."""
+        return self.required_hours - self.hours_until_flight
+
+    @property
+    def message(self) -> str:
+        """Detailed explanation of the safety status."""
+        if self.hours_until_flight < 0:
+            return _FLIGHT_BEFORE_DIVE_MSG
+        if self.safe:
+            return _SAFE_FMT.format(self.hours_until_flight, self.required_hours)
+        return _UNSAFE_FMT.format(self.hours_short)
 
 class DiveTravelCalculator:
     """
@@ -23,28 +88,36 @@ class DiveTravelCalculator:
     organizations to help divers plan their post-dive travel safely.
     """
     
-    def __init__(self):
-        """
-        Initialize the calculator with recommended surface intervals.
-        
-        Surface intervals are defined in hours for each organization,
-        with different requirements for single and multiple dive scenarios.
-        """
-        # Define recommended surface intervals (in hours) for each organization
-        self.surface_intervals = {
-            'DAN': {
-                'single': 12,    # DAN recommends 12h minimum after single dive
-                'multiple': 18   # 18h after multiple dives
-            },
-            'PADI': {
-                'single': 12,    # PADI follows similar guidelines to DAN
-                'multiple': 18
-            },
-            'NAUI': {
-                'single': 24,    # NAUI is more conservative with 24h for all scenarios
-                'multiple': 24
-            }
+    # Instances carry no state of their own; the tables below are shared
+    __slots__ = ()
+    
+    # Recommended surface intervals (in hours) for each organization, with
+    # different requirements for single and multiple dive scenarios
+    surface_intervals = MappingProxyType({
+        'DAN': {
+            'single': 12,    # DAN recommends 12h minimum after single dive
+            'multiple': 18   # 18h after multiple dives
+        },
+        'PADI': {
+            'single': 12,    # PADI follows similar guidelines to DAN
+            'multiple': 18
+        },
+        'NAUI': {
+            'single': 24,    # NAUI is more conservative with 24h for all scenarios
+            'multiple': 24
         }
+    })
+    # The same intervals as a (single, multiple) pair per organization, so a
+    # lookup is one probe on the name and an index by multiple_dives
+    _dispatch = MappingProxyType({
+        org: (hours['single'], hours['multiple'])
+        for org, hours in surface_intervals.items()
+    })
+    # And in seconds, for comparisons against whole-second surface intervals
+    _dispatch_seconds = MappingProxyType({
+        org: (single * 3600, multiple * 3600)
+        for org, (single, multiple) in _dispatch.items()
+    })
 
     def get_required_interval(self, organization: str, multiple_dives: bool) -> int:
         """
@@ -60,14 +133,14 @@ class DiveTravelCalculator:
         Raises:
             ValueError: If organization is not recognized
         """
-        if organization not in self.surface_intervals:
-            raise ValueError(f"Unknown organization: {organization}")
-        
-        dive_type = 'multiple' if multiple_dives else 'single'
-        return self.surface_intervals[organization][dive_type]
+        try:
+            return self._dispatch[organization][bool(multiple_dives)]
+        except KeyError:
+            raise ValueError(f"Unknown organization: {organization}") from None
 
     def is_safe_to_fly(self, last_dive_time: datetime, flight_time: datetime, 
-                       organization: str, multiple_dives: bool) -> Tuple[bool, str]:
+                       organization: str, multiple_dives: bool,
+                       verbose: bool = True) -> Union[Tuple[bool, str], SafetyResult]:
         """
         Check if it's safe to fly based on the last dive and organization guidelines.
         
@@ -76,24 +149,177 @@ class DiveTravelCalculator:
             flight_time (datetime): Planned flight departure time
             organization (str): Name of diving organization (DAN/PADI/NAUI)
             multiple_dives (bool): Whether multiple dives were performed
+            verbose (bool): Return the (is_safe, message) pair. When False, a
+                SafetyResult is returned instead and no message is formatted
+                unless its message property is read. Defaults to True.
         
         Returns:
-            Tuple[bool, str]: (is_safe, message)
+            Tuple[bool, str]: (is_safe, message) when verbose is True
                 - is_safe: True if enough surface interval time has passed
                 - message: Detailed explanation of the safety status
+            SafetyResult: The verdict and its figures when verbose is False
         """
         required_hours = self.get_required_interval(organization, multiple_dives)
-        time_diff = flight_time - last_dive_time
-        hours_until_flight = time_diff.total_seconds() / 3600
+        if not verbose:
+            return _assess(last_dive_time, flight_time, required_hours)
+        return _compute_safety(last_dive_time, flight_time, required_hours)
+
+    def specialize(self, organization: str) -> Callable[[datetime, datetime, bool], Tuple[bool, str]]:
+        """
+        Build an is_safe_to_fly for one organization's guidelines.
+        
+        The organization is looked up once here rather than on every check,
+        for callers that always use the same guidelines.
+        
+        Args:
+            organization (str): Name of diving organization (DAN/PADI/NAUI)
+        
+        Returns:
+            Callable[[datetime, datetime, bool], Tuple[bool, str]]: Function
+                taking (last_dive_time, flight_time, multiple_dives) and
+                returning (is_safe, message) as is_safe_to_fly does
+            
+        Raises:
+            ValueError: If organization is not recognized
+        """
+        try:
+            intervals = self._dispatch[organization]
+        except KeyError:
+            raise ValueError(f"Unknown organization: {organization}") from None
 
-        if hours_until_flight < 0:
-            return False, "Error: Flight time is before dive time!"
+        def is_safe_to_fly(last_dive_time: datetime, flight_time: datetime,
+                           multiple_dives: bool) -> Tuple[bool, str]:
+            return _compute_safety(last_dive_time, flight_time,
+                                   intervals[bool(multiple_dives)])
+        return is_safe_to_fly
 
-        if hours_until_flight >= required_hours:
-            return True, f"✅ Safe to fly! You'll have {hours_until_flight:.1f} hours of surface interval (minimum required: {required_hours} hours)"
+    def is_safe_to_fly_batch(self, last_dive_times, flight_times, organizations,
+                             multiple_dives):
+        """
+        Check many dive/flight pairs at once.
+        
+        Gives the same verdicts as is_safe_to_fly, computed with numpy over
+        whole arrays instead of one call per diver.
+        
+        Args:
+            last_dive_times (Sequence[datetime]): Times when each last dive ended
+            flight_times (Sequence[datetime]): Planned flight departure times
+            organizations (str or Sequence[str]): Organization for every pair,
+                or one per pair
+            multiple_dives (bool or Sequence[bool]): Multiple-dive flag for every
+                pair, or one per pair
+        
+        Returns:
+            Tuple[numpy.ndarray, numpy.ndarray]: (is_safe, hours_short)
+                - is_safe: Boolean array, True where the flight is safe
+                - hours_short: Hours of surface interval still needed for each
+                  pair; zero or negative where the flight is safe
+        
+        Raises:
+            ValueError: If any organization is not recognized
+        """
+        # numpy is only needed here, so importing this module stays cheap
+        import numpy as np
+        
+        last = np.asarray(last_dive_times, dtype="datetime64[us]")
+        flight = np.asarray(flight_times, dtype="datetime64[us]")
+        multiple = np.broadcast_to(np.asarray(multiple_dives, dtype=bool), last.shape)
+        
+        # Required interval per pair in seconds, looked up once per distinct
+        # organization and picked by the multiple-dive flag in one pass
+        def required_for(org):
+            try:
+                single, multi = self._dispatch_seconds[org]
+            except KeyError:
+                raise ValueError(f"Unknown organization: {org}") from None
+            return np.where(multiple, multi, single)
+        
+        if isinstance(organizations, str):
+            required_seconds = required_for(organizations).astype(np.int64, copy=False)
         else:
-            hours_short = required_hours - hours_until_flight
-            return False, f"⚠️ NOT safe to fly! You need {hours_short:.1f} more hours of surface interval"
+            orgs = np.asarray(organizations, dtype=object)
+            required_seconds = np.empty(last.shape, dtype=np.int64)
+            for org in set(organizations):
+                mask = orgs == org
+                required_seconds[mask] = required_for(org)[mask]
+        
+        # Results are written into arrays already allocated wherever possible,
+        # so a large batch makes few temporaries
+        gap = flight - last
+        seconds_short = np.divide(gap, np.timedelta64(1, "s"))
+        np.subtract(required_seconds, seconds_short, out=seconds_short)
+        hours_short = np.divide(seconds_short, 3600, out=seconds_short)
+        
+        # Same rule as _assess: whole seconds against the requirement, and a
+        # flight before the dive is never safe
+        seconds_until_flight = np.floor_divide(gap, np.timedelta64(1, "s"))
+        is_safe = np.greater_equal(seconds_until_flight, required_seconds)
+        is_safe &= seconds_until_flight >= 0
+        return is_safe, hours_short
+
+def _assess(last_dive_time: datetime, flight_time: datetime,
+            required_hours: int) -> SafetyResult:
+    """
+    Work out the safety verdict for a dive/flight pair and required interval.
+    
+    Args:
+        last_dive_time (datetime): Time when the last dive ended
+        flight_time (datetime): Planned flight departure time
+        required_hours (int): Minimum surface interval in hours
+    
+    Returns:
+        SafetyResult: The verdict, without its message formatted
+    """
+    time_diff = flight_time - last_dive_time
+    # Whole seconds of the gap, floored; the requirement is a whole number of
+    # seconds too, so comparing integers gives the same verdict as comparing
+    # fractional hours
+    seconds_until_flight = time_diff.days * 86400 + time_diff.seconds
+    is_safe = seconds_until_flight >= 0 and seconds_until_flight >= required_hours * 3600
+    return SafetyResult(is_safe, time_diff.total_seconds() / 3600, required_hours)
+
+@lru_cache(maxsize=1024)
+def _compute_safety(last_dive_time: datetime, flight_time: datetime,
+                    required_hours: int) -> Tuple[bool, str]:
+    """
+    Work out the (is_safe, message) pair returned by is_safe_to_fly.
+    
+    Pure in its arguments, so repeated checks of the same plan are served
+    from the cache, message included.
+    
+    Args:
+        last_dive_time (datetime): Time when the last dive ended
+        flight_time (datetime): Planned flight departure time
+        required_hours (int): Minimum surface interval in hours
+    
+    Returns:
+        Tuple[bool, str]: (is_safe, message), as for is_safe_to_fly
+    """
+    result = _assess(last_dive_time, flight_time, required_hours)
+    return result.safe, result.message
+
+def _parse_datetime(date_str: str) -> datetime:
+    """
+    Parse a date and time in the "YYYY-MM-DD HH:MM" format.
+    
+    Zero-padded input, the documented format, is matched by a precompiled
+    pattern without going through strptime's generic format machinery;
+    anything else falls back to strptime, which also accepts unpadded fields.
+    
+    Args:
+        date_str (str): Date and time to parse
+    
+    Returns:
+        datetime: The parsed date and time
+    
+    Raises:
+        ValueError: If the string is not a valid date and time in this format
+    """
+    match = _DATETIME_RE.fullmatch(date_str)
+    if match:
+        year, month, day, hour, minute = match.groups()
+        return datetime(int(year), int(month), int(day), int(hour), int(minute))
+    return datetime.strptime(date_str, "%Y-%m-%d %H:%M")
 
 def get_datetime_input(prompt: str) -> Optional[datetime]:
     """
@@ -114,7 +340,7 @@ def get_datetime_input(prompt: str) -> Optional[datetime]:
     while True:
         try:
             date_str = input(prompt + " (format: YYYY-MM-DD HH:MM): ")
-            return datetime.strptime(date_str, "%Y-%m-%d %H:%M")
+            return _parse_datetime(date_str)
         except ValueError:
             print("Invalid date format. Please use YYYY-MM-DD HH:MM (e.g., 2025-03-26 14:30)")
         except KeyboardInterrupt:
@@ -130,19 +356,12 @@ def main():
     3. Entering dive and flight times
     4. Receiving safety assessment and recommendations
     """
-    print("\n=== Dive Travel Safety Calculator ===\n")
-    print("This calculator helps determine if it's safe to fly after diving based on")
-    print("recommended surface intervals from major diving organizations.\n")
+    # Introduction and organization menu
+    print(_CLI_INTRO)
     
     # Create calculator instance
     calculator = DiveTravelCalculator()
     
-    # Get organization preference
-    print("Which organization's guidelines do you follow?")
-    print("1. DAN (Divers Alert Network)")
-    print("2. PADI (Professional Association of Diving Instructors)")
-    print("3. NAUI (National Association of Underwater Instructors)")
-    
     while True:
         org_choice = input("\nEnter number (1-3): ").strip()
         if org_choice == "1":
@@ -178,14 +397,7 @@ def main():
     print(message)
     
     if not is_safe:
-        print("\n⚠️ WARNING: Flying too soon after diving increases your risk of")
-        print("decompression sickness (DCS). Symptoms may include:")
-        print("- Joint pain")
-        print("- Numbness or tingling")
-        print("- Dizziness")
-        print("- Difficulty breathing")
-        print("\nPlease follow the recommended surface interval guidelines")
-        print("for your safety. Consider rebooking your flight if possible.")
+        print(_DCS_WARNING)
     
     print("=" * 50 + "\n")
 
@@ -0,0 +1,170 @@
+"""
+JSON Lines Storage Helpers
+
+This module holds the file handling shared by the dive log and dive journal
+modules, which both store their records one JSON object per line in an
+append-only file.
+
+Features:
+- Optional orjson speedup, with the standard library json as a fallback
+- Equivalent JSON whichever encoder is used, readable by either
+- Loading that skips damaged lines instead of failing the whole file
+- Conversion of the single JSON array files used by earlier versions
+- Appending a record without rewriting the file
+"""
+
+import json
+import math
+import os
+from typing import Any, Dict, List
+
+try:
+    import orjson
+except ImportError:  # optional speedup; the standard library json is used instead
+    orjson = None
+
+def encode_line(record: Dict[str, Any]) -> bytes:
+    """
+    Serialize one record as a JSON Lines line.
+
+    Uses orjson when it is installed and the standard library otherwise.
+
+    Args:
+        record (Dict[str, Any]): Record to serialize
+
+    Returns:
+        bytes: UTF-8 encoded JSON followed by a newline
+    """
+    if orjson is not None:
+        return orjson.dumps(record) + b"\n"
+    # Equivalent to what orjson writes, though not byte for byte (floats in
+    # exponent form differ, e.g. 1e+16 against 1e16): compact, non-ASCII text
+    # as UTF-8 rather than \u escapes, and NaN or infinity as null since
+    # orjson cannot read them back
+    try:
+        text = json.dumps(record, separators=(",", ":"), ensure_ascii=False, allow_nan=False)
+    except ValueError:
+        text = json.dumps(_finite(record), separators=(",", ":"), ensure_ascii=False)
+    return text.encode() + b"\n"
+
+def _finite(value: Any) -> Any:
+    """
+    Copy of a JSON value with every NaN or infinite float replaced by None.
+
+    Args:
+        value (Any): Value to copy
+
+    Returns:
+        Any: The value with non-finite floats as None
+    """
+    if isinstance(value, float):
+        return value if math.isfinite(value) else None
+    if isinstance(value, dict):
+        return {key: _finite(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_finite(item) for item in value]
+    return value
+
+def decode_line(line: bytes) -> Any:
+    """
+    Parse one JSON Lines line.
+
+    Args:
+        line (bytes): Line read from the file
+
+    Returns:
+        Any: The decoded JSON value
+
+    Raises:
+        ValueError: If the line is not valid JSON
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(line)
+        except orjson.JSONDecodeError:
+            # Files written by earlier versions without orjson may hold NaN,
+            # which only the standard library parser accepts
+            pass
+    return json.loads(line)
+
+def read_records(path: str) -> List[Dict[str, Any]]:
+    """
+    Load every record from a JSON Lines file.
+
+    Lines that cannot be decoded, such as a save cut short or a bad hand
+    edit, are skipped so the remaining records still load.
+
+    Args:
+        path (str): Path to the JSON Lines file
+
+    Returns:
+        List[Dict[str, Any]]: Records in file order. Returns empty list if
+            the file doesn't exist.
+    """
+    records = []
+    try:
+        with open(path, "rb") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    record = decode_line(line)
+                except ValueError:
+                    continue
+                if isinstance(record, dict):
+                    records.append(record)
+    except FileNotFoundError:
+        pass
+    return records
+
+def migrate_legacy_array(legacy_path: str, path: str) -> None:
+    """
+    Convert a legacy JSON array file to JSON Lines.
+
+    Runs only when the JSON Lines file does not exist yet; the legacy file is
+    left in place untouched, and one that cannot be decoded is ignored.
+
+    Args:
+        legacy_path (str): Path to the file holding a single JSON array
+        path (str): Path to the JSON Lines file to create
+    """
+    if os.path.exists(path) or not os.path.exists(legacy_path):
+        return
+    try:
+        with open(legacy_path, "r") as f:
+            records = json.load(f)
+    except json.JSONDecodeError:
+        return
+    with open(path, "wb") as f:
+        for record in records:
+            f.write(encode_line(record))
+
+def append_record(path: str, record: Dict[str, Any]) -> int:
+    """
+    Append one record to the end of a JSON Lines file.
+
+    Args:
+        path (str): Path to the JSON Lines file; created if missing
+        record (Dict[str, Any]): Record to append
+
+    Returns:
+        int: Number of bytes written
+
+    Raises:
+        OSError: If the record could not be written
+    """
+    # The record is written at the end of the file in a single write() where
+    # possible, so saves from other sessions do not interleave with it. A
+    # short write is finished off rather than leaving half a record behind
+    data = memoryview(encode_line(record))
+    size = len(data)
+    fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    try:
+        while data:
+            written = os.write(fd, data)
+            if written == 0:
+                raise OSError(f"Could not write record to {path}")
+            data = data[written:]
+    finally:
+        os.close(fd)
+    return size